@@ -37,23 +37,32 @@
 
 ■ 動作に必要なパッケージ
 - PySide6
+- orjson（任意。入っていれば JSON の読み書きに使う。無ければ標準の json）
 
-    pip install PySide6
+    pip install PySide6 orjson
 
 """
 
 import json
 import os
+from bisect import bisect_right
+from functools import lru_cache
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Tuple
+from pathlib import Path
+from typing import Any, List, Dict, Tuple
+
+try:
+    import orjson  # 任意：高速な JSON 読み書き
+except ImportError:
+    orjson = None
 
 from PySide6.QtGui import QAction, QFont, QColor, QBrush, QPen
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSize, QPropertyAnimation, QEasingCurve, QSignalBlocker, QTimer, QEvent
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSize, QDate, Signal, QPropertyAnimation, QEasingCurve, QTimer, QEvent, QObject, QRunnable, QThreadPool
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QComboBox, QPushButton, QTableView, QSplitter, QTextEdit, QMessageBox,
     QCheckBox, QHeaderView, QMenu, QToolButton, QListView,
-    QDialog, QDialogButtonBox, QTableWidget, QTableWidgetItem, QAbstractItemView,
+    QDialog, QDialogButtonBox, QAbstractItemView,
     QDateEdit, QSpinBox, QLineEdit, QStyledItemDelegate, QAbstractScrollArea
 )
 
@@ -67,11 +76,40 @@ SPECIAL_QUOTAS_JSON  = os.path.join(DATA_DIR, 'special_quota.json')   # 個別
 # 祝日を手入力／インポートで管理（例: {"holidays": ["2025-01-01","2025-02-11", ...] }）
 HOLIDAYS_JSON = os.path.join(DATA_DIR, "holidays.json")
 
+# 曜日ごとの設定（基本）の初期値
+WEEKDAY_RULES_TEMPLATE = {
+    "weekday_rules": {
+        "0": {"min_work": 5, "min_managers": 1, "leader_required": True},
+        "1": {"min_work": 5, "min_managers": 1, "leader_required": True},
+        "2": {"min_work": 5, "min_managers": 1, "leader_required": True},
+        "3": {"min_work": 5, "min_managers": 1, "leader_required": True},
+        "4": {"min_work": 5, "min_managers": 1, "leader_required": True},
+        "5": {"min_work": 6, "min_managers": 1, "leader_required": True},  # 土
+        "6": {"min_work": 6, "min_managers": 1, "leader_required": True},  # 日
+    }
+}
+
 STATUS_ORDER        = [" ", "休"]
+REST_STATUSES       = ("休", "休*")
 
 # 役職者（固定名）
 MANAGERS            = ["迫", "田嶋", "齋藤", "田中"]
 
+# セル背景/枠の描画用（描画のたびに生成しないよう共有）
+_BRUSH_WISH = QBrush(QColor(255, 140, 0))          # 希望休：オレンジ
+_BRUSH_VAC  = QBrush(QColor(0, 170, 255, 80))      # 長期休暇：水色帯
+_BRUSH_HOL  = QBrush(QColor(255, 130, 150, 160))   # 日曜・祝日：明るめピンク
+_BRUSH_SAT  = QBrush(QColor(70, 170, 255, 160))    # 土曜：明るめシアン
+_PEN_PAID   = QPen(QColor(220, 50, 47))            # 有給希望の赤枠
+_PEN_PAID.setWidth(2)
+
+# チェック結果の文言（違反があった時だけ format する）
+CHECK_MSG_WORK_SHORT    = "{m}/{d}: 出勤者が不足（{cnt}/{need}）"
+CHECK_MSG_MANAGER_SHORT = "{m}/{d}: 管理職が不足（{cnt}/{need}）"
+CHECK_MSG_NO_LEADER     = "{m}/{d}: リーダーが不在"
+# スタッフ数×日数がこれ以上ならチェックをワーカースレッドで実行する（約16人×31日〜。小さい表はその場で）
+CHECK_ASYNC_THRESHOLD   = 500
+
 DARK_STYLESHEET = """
 QWidget { background-color: #101214; color: #E6E6E6; font-family: 'Meiryo UI','Segoe UI',sans-serif; }
 QLabel { color: #DADCE0; }
@@ -94,23 +132,193 @@ DARK_STYLESHEET += """
 
 # ---------- ユーティリティ ----------
 
-def ensure_data_dir():
+def init_data_dir():
+    """起動時に一度だけ：data ディレクトリとテンプレート付き設定ファイルをまとめて用意する"""
     os.makedirs(DATA_DIR, exist_ok=True)
+    # members.json は load_or_init_staffs が既定メンバー（入職日付き）で作る
+    for path, template in (
+        (VACATIONS_JSON, {"vacations": []}),
+        (WEEKDAY_RULES_JSON, WEEKDAY_RULES_TEMPLATE),
+        (SPECIAL_QUOTAS_JSON, {"periods": []}),
+    ):
+        ensure_file_with_template(path, template)
 
 
 def load_json(path: str, default):
-    if not os.path.exists(path):
-        return default
+    return try_load_json(path, default)[0]
+
+
+def try_load_json(path: str, default) -> tuple[Any, bool]:
+    """
+    load_json と同じだが、ファイルが存在したかどうかも返す（exists で事前に stat しない）。
+    ファイルが無ければ (default, False)、読めない/壊れている場合は (default, True)。
+    """
+    try:
+        raw = Path(path).read_bytes()
+    except FileNotFoundError:
+        return default, False
+    except Exception:
+        return default, True
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return (orjson.loads(raw) if orjson else json.loads(raw)), True
     except Exception:
+        return default, True
+
+
+# path -> (st_mtime_ns, st_size, 解析済みオブジェクト)
+_JSON_CACHE: dict[str, tuple[int, int, Any]] = {}
+
+
+def load_json_cached(path: str, default):
+    """
+    load_json のキャッシュ版（設定ファイルの参照用）。mtime とサイズが変わっていなければ前回の解析結果を返す。
+    戻り値はキャッシュと共有しているので、呼び出し側で変更しないこと。
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
         return default
+    hit = _JSON_CACHE.get(path)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    obj = load_json(path, None)
+    if obj is None:
+        return default
+    _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, obj)
+    return obj
+
+
+def dump_json_bytes(obj) -> bytes:
+    if orjson:
+        # int キー（日付）もそのまま文字列キーとして書き出す
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
 
 
 def save_json(path: str, obj):
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    Path(path).write_bytes(dump_json_bytes(obj))
+    _JSON_CACHE.pop(path, None)
+
+
+class SaveSignals(QObject):
+    """SaveTask の完了通知（QRunnable は QObject ではないのでシグナルはこちらに持たせる）"""
+    finished = Signal(str)        # path
+    failed = Signal(str, str)     # path, エラーメッセージ
+
+
+class SaveTask(QRunnable):
+    """シリアライズ済みのバイト列を一時ファイルに書いてから置き換える（書き込み途中のファイルを残さない）"""
+    def __init__(self, path: str, raw: bytes):
+        super().__init__()
+        self.path = path
+        self.raw = raw
+        self.signals = SaveSignals()
+
+    def run(self):
+        tmp = self.path + ".tmp"
+        try:
+            Path(tmp).write_bytes(self.raw)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            self.signals.failed.emit(self.path, str(e))
+            return
+        _JSON_CACHE.pop(self.path, None)
+        self.signals.finished.emit(self.path)
+
+
+def save_json_async(pool: QThreadPool, path: str, obj) -> SaveTask:
+    """
+    obj を UI スレッドでバイト列にしてから（呼び出し後に obj を書き換えても影響しない）、書き込みだけを pool で行う。
+    同じファイルへの保存順を守るため、pool は最大スレッド数 1 のものを渡すこと。
+    """
+    task = SaveTask(path, dump_json_bytes(obj))
+    pool.start(task)
+    return task
+
+
+def run_shift_check(plan, rules: dict, req_min_work: dict, names: list[str], status_rows: list[dict],
+                    is_mgr: list[bool], leaders: dict[int, str]) -> list[str] | None:
+    """
+    必要出勤数/管理職最少/リーダー必須を日ごとに確認し、違反メッセージを返す（違反なしは None）。
+    Qt のオブジェクトには触らないので、ワーカースレッドからも呼べる。
+    plan: build_period_plan の結果 / names・status_rows・is_mgr: スタッフ順の並列リスト
+    leaders: 日 -> その日に選ばれたリーダーの氏名（未選択は "" / "-"）
+    """
+    n_staff = len(status_rows)
+    row_of = dict(zip(names, status_rows))
+    msgs = None  # 違反が出た時だけ作る（違反なしが普通）
+
+    for d, _yy, mm, wd, _dt in plan:  # wd: 0=月 . 6=日
+        r = rules.get(str(wd), {})
+
+        # --- 必要出勤数（特別期間優先） ---
+        # 1) モデルが持つ req_min_work（日ごと、特別期間を含めた最終値）
+        need_work = int(req_min_work.get(d, 0) or 0)
+        # 2) 無ければ曜日ルールの min_work をフォールバック
+        if need_work == 0:
+            need_work = int(r.get("min_work", 0))
+
+        # --- 管理職最少/リーダー必須（曜日ルール準拠） ---
+        min_managers = int(r.get("min_managers", 0))
+        leader_req = bool(r.get("leader_required", False))
+
+        # 出勤者 / 管理職の出勤者を1回の走査で数える（" " が出勤）
+        work_cnt = mgr_work = 0
+        for i in range(n_staff):
+            if status_rows[i].get(d) == " ":
+                work_cnt += 1
+                if is_mgr[i]:
+                    mgr_work += 1
+
+        # その日に選ばれたリーダーが出勤しているか
+        leader_row = row_of.get(leaders.get(d))
+        leader_present = leader_row is not None and leader_row.get(d) == " "
+
+        # 必要出勤数チェック（特別期間を含む最終値）
+        if need_work and work_cnt < need_work:
+            msgs = msgs or []
+            msgs.append(CHECK_MSG_WORK_SHORT.format(m=mm, d=d, cnt=work_cnt, need=need_work))
+
+        # 管理職チェック（曜日ルール）
+        if min_managers and mgr_work < min_managers:
+            msgs = msgs or []
+            msgs.append(CHECK_MSG_MANAGER_SHORT.format(m=mm, d=d, cnt=mgr_work, need=min_managers))
+
+        # リーダー必須チェック（未選択、または選ばれたリーダーが出勤していない場合）
+        if leader_req and not leader_present:
+            msgs = msgs or []
+            msgs.append(CHECK_MSG_NO_LEADER.format(m=mm, d=d))
+
+    return msgs
+
+
+class CheckSignals(QObject):
+    """CheckTask の完了通知"""
+    finished = Signal(object)     # list[str] | None
+
+
+class CheckTask(QRunnable):
+    """run_shift_check をワーカースレッドで実行する（引数はモデルから切り離したコピーを渡すこと）"""
+    def __init__(self, plan, rules: dict, req_min_work: dict, names: list[str], status_rows: list[dict],
+                 is_mgr: list[bool], leaders: dict[int, str]):
+        super().__init__()
+        self.plan = plan
+        self.rules = rules
+        self.req_min_work = req_min_work
+        self.names = names
+        self.status_rows = status_rows
+        self.is_mgr = is_mgr
+        self.leaders = leaders
+        self.signals = CheckSignals()
+
+    def run(self):
+        try:
+            msgs = run_shift_check(self.plan, self.rules, self.req_min_work, self.names, self.status_rows,
+                                   self.is_mgr, self.leaders)
+        except Exception as e:
+            # 完了通知が来ないと実行中のままになるので、エラーも結果として返す
+            msgs = [f"チェック中にエラーが発生しました: {e}"]
+        self.signals.finished.emit(msgs)
 
 
 def month_last_day(year: int, month: int) -> int:
@@ -124,8 +332,102 @@ def month_last_day(year: int, month: int) -> int:
 def is_weekend(y: int, m: int, d: int) -> bool:
     return date(y, m, d).weekday() >= 5  # 5:土,6:日
 
+@lru_cache(maxsize=256)
+def period_days(year: int, month: int) -> tuple[int, ...]:
+    """(year, month) の16日に始まる期間の日の並び：16〜月末 → 1〜15"""
+    return tuple(range(16, month_last_day(year, month) + 1)) + tuple(range(1, 16))
+
+def build_period_plan(year: int, month: int, days) -> tuple[tuple[int, int, int, int, date], ...]:
+    """
+    期間の各日を (日, 年, 月, 曜日(0=月..6=日), date) に展開する。
+    16〜月末は (year, month) / 1〜15は翌月。連続する日は date を1日ずつ進め、曜日も (wd+1)%7 で求める。
+    """
+    next_y, next_m = (year + 1, 1) if month == 12 else (year, month + 1)
+    plan = []
+    cur, wd = None, 0
+    for d in days:
+        if cur is None or cur.day != d:
+            cur = date(year, month, d) if d >= 16 else date(next_y, next_m, d)
+            wd = cur.weekday()
+        plan.append((d, cur.year, cur.month, wd, cur))
+        cur += timedelta(days=1)
+        wd = (wd + 1) % 7
+    return tuple(plan)
+
+@lru_cache(maxsize=64)
+def period_plan(year: int, month: int) -> tuple[tuple[int, int, int, int, date], ...]:
+    """period_days(year, month) の build_period_plan（期間ごとに1回だけ作って共有）"""
+    return build_period_plan(year, month, period_days(year, month))
+
+def qdate_from_iso(iso_str: str | None) -> QDate:
+    """"YYYY-MM-DD" を Qt 側で直接 QDate に変換（空・不正なら今日）"""
+    qd = QDate.fromString(iso_str, Qt.ISODate) if iso_str else QDate.currentDate()
+    return qd if qd.isValid() else QDate.currentDate()
+
+# PySide6 の QDate は toPython() を持つ（PyQt 等には無い）。判定は import 時に1回だけ
+_HAS_TOPYTHON = hasattr(QDate(2000, 1, 1), "toPython")
+
+def qdate_to_date(qd: QDate) -> date:
+    """QDate -> datetime.date"""
+    return qd.toPython() if _HAS_TOPYTHON else date.fromisoformat(qd.toString('yyyy-MM-dd'))
+
+@lru_cache(maxsize=512)
+def parse_iso_date(iso_str: str) -> date:
+    """"YYYY-MM-DD" -> date（同じ文字列は再解析しない）"""
+    return date.fromisoformat(iso_str)
+
+@lru_cache(maxsize=8)
+def _parse_holidays(path: str, mtime_ns: int, size: int) -> frozenset[date]:
+    """祝日ファイルを date の集合にする。不正な行は読み飛ばす（mtime ごとに1回だけ）"""
+    obj = load_json(path, {"holidays": []})
+    out = set()
+    for s in (obj.get("holidays", []) if isinstance(obj, dict) else []):
+        try:
+            out.add(parse_iso_date(s))
+        except (TypeError, ValueError):
+            pass
+    return frozenset(out)
+
+def load_holiday_set() -> frozenset[date]:
+    """HOLIDAYS_JSON の祝日集合（ファイルが更新されたら読み直す）"""
+    try:
+        st = os.stat(HOLIDAYS_JSON)
+    except OSError:
+        return frozenset()
+    return _parse_holidays(HOLIDAYS_JSON, st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=8)
+def _parse_special_quotas(path: str, mtime_ns: int, size: int) -> tuple[tuple[date, date, int], ...]:
+    """特別期間を (開始, 終了, 必要出勤数) に解析する。開始>終了は入れ替え、不正な行は読み飛ばす"""
+    obj = load_json(path, {"periods": []})
+    out = []
+    for p in (obj.get("periods", []) if isinstance(obj, dict) else []):
+        try:
+            d0 = parse_iso_date(p.get("start"))
+            d1 = parse_iso_date(p.get("end"))
+            mw = int(p.get("min_work", 0))
+        except Exception:
+            continue
+        if d1 < d0:
+            d0, d1 = d1, d0
+        out.append((d0, d1, mw))
+    return tuple(out)
+
+def load_special_quota_intervals() -> tuple[tuple[date, date, int], ...]:
+    """SPECIAL_QUOTAS_JSON の特別期間（ファイルが更新されたら読み直す）"""
+    try:
+        st = os.stat(SPECIAL_QUOTAS_JSON)
+    except OSError:
+        return ()
+    return _parse_special_quotas(SPECIAL_QUOTAS_JSON, st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=512)
+def parse_hire_date(s: str) -> date:
+    """入職日 "YYYY-MM-DD" -> date。手入力の "2024-4-1" のようなゼロ埋め無しも受け付ける"""
+    return datetime.strptime(s, '%Y-%m-%d').date()
+
 def ensure_file_with_template(path: str, template_obj):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # data ディレクトリ自体は init_data_dir（起動時）で作成済み
     if not os.path.exists(path):
         save_json(path, template_obj)
 
@@ -136,45 +438,97 @@ def open_json_in_explorer(path: str, template_obj):
     except Exception:
         QMessageBox.information(None, "情報", f"設定ファイルを手動で開いて編集してください:\n{path}")
 
+def index_vacations(vacations_obj) -> dict[str, list[tuple[int, int]]]:
+    """長期休暇データを {メンバー名: [(開始ordinal, 終了ordinal), ...]}（開始順）に変換"""
+    index: dict[str, list[tuple[int, int]]] = {}
+    vacs = vacations_obj.get("vacations", []) if isinstance(vacations_obj, dict) else []
+    for v in vacs:
+        try:
+            o0 = date.fromisoformat(v.get("start")).toordinal()
+            o1 = date.fromisoformat(v.get("end")).toordinal()
+        except Exception:
+            continue
+        if o1 < o0:
+            o0, o1 = o1, o0
+        index.setdefault(v.get("member", ""), []).append((o0, o1))
+    for spans in index.values():
+        spans.sort()
+    return index
+
+
+@lru_cache(maxsize=8)
+def _parse_vacations(path: str, mtime_ns: int, size: int) -> dict[str, list[tuple[int, int]]]:
+    """長期休暇ファイルを index_vacations の形に解析する（ファイルの版ごとに1回だけ）"""
+    return index_vacations(load_json(path, {"vacations": []}))
+
+
+def load_vacation_index() -> dict[str, list[tuple[int, int]]]:
+    """
+    VACATIONS_JSON を解析した index（ファイルが更新されたら読み直す）。
+    戻り値はキャッシュと共有しているので、呼び出し側で変更しないこと。
+    """
+    try:
+        st = os.stat(VACATIONS_JSON)
+    except OSError:
+        return {}
+    return _parse_vacations(VACATIONS_JSON, st.st_mtime_ns, st.st_size)
+
+
 def build_vacation_map(year: int, month: int, days: list[int], vacations_obj: dict, staff_names: list[str]) -> dict[str, set]:
     """長期休暇データから {メンバー名: {日,...}} を作る"""
-    vac_map: dict[str, set] = {name: set() for name in staff_names}
     if not vacations_obj:
+        return {name: set() for name in staff_names}
+    return vacation_map_from_index(year, month, days, index_vacations(vacations_obj), staff_names)
+
+
+def vacation_map_from_index(year: int, month: int, days: list[int], index: dict[str, list[tuple[int, int]]],
+                            staff_names: list[str]) -> dict[str, set]:
+    """index_vacations / load_vacation_index の index から {メンバー名: {日,...}} を作る"""
+    vac_map: dict[str, set] = {name: set() for name in staff_names}
+    if not days or not index:
         return vac_map
-    vacs = vacations_obj.get("vacations", []) if isinstance(vacations_obj, dict) else []
-    for v in vacs:
-        member = v.get("member", "")
+    # 期間の各日を通日(ordinal)に変換（16〜月末は当月 / 1〜15は翌月）
+    next_y, next_m = (year + 1, 1) if month == 12 else (year, month + 1)
+    day_of_ord = {date(year, month, d).toordinal() if d >= 16 else date(next_y, next_m, d).toordinal(): d
+                  for d in days}
+    period_start_ord = min(day_of_ord)
+    period_end_ord = max(day_of_ord)
+    for member, spans in index.items():
         if member not in vac_map:
             continue
-        try:
-            d0 = date.fromisoformat(v.get("start"))
-            d1 = date.fromisoformat(v.get("end"))
-        except Exception:
-            continue
-        if d1 < d0:
-            d0, d1 = d1, d0
-        for d in days:
-            cur = date(year, month, d)
-            if d0 <= cur <= d1:
-                vac_map[member].add(d)
+        # 開始が期間末以前の区間だけを見る（開始順に並んでいるので二分探索で打ち切り）
+        for o0, o1 in spans[:bisect_right(spans, (period_end_ord, float("inf")))]:
+            # 休暇区間と期間の重なりだけを整数演算で取り出す
+            lo = max(o0, period_start_ord)
+            hi = min(o1, period_end_ord)
+            vac_map[member].update(day_of_ord[o] for o in range(lo, hi + 1) if o in day_of_ord)
     return vac_map
 
 
 # ---------- モデル ----------
 
+# (氏名, 入職日, 管理職) -> Staff。Staff は読み込み後に書き換えないので共有してよい
+_STAFF_CACHE: dict[tuple[str, str, bool], "Staff"] = {}
+
+
 class Staff:
     def __init__(self, name: str, is_manager: bool = False, hire_date: str = None):
         self.name = name
         self.is_manager = is_manager
-        self.hire_date = datetime.strptime(hire_date, '%Y-%m-%d').date() if hire_date else None
+        self.hire_date = parse_hire_date(hire_date) if hire_date else None
 
     @staticmethod
     def from_dict(d: Dict):
-        return Staff(
-            name=d.get('name'),
-            is_manager=d.get('is_manager', False),
-            hire_date=d.get('hire_date')
-        )
+        # メンバー管理を閉じるたびに全員分作り直すので、同じ内容の Staff は使い回す
+        key = (d.get('name'), d.get('hire_date') or "", bool(d.get('is_manager', False)))
+        s = _STAFF_CACHE.get(key)
+        if s is None:
+            s = _STAFF_CACHE[key] = Staff(
+                name=d.get('name'),
+                is_manager=d.get('is_manager', False),
+                hire_date=d.get('hire_date')
+            )
+        return s
 
     def to_dict(self):
         return {
@@ -190,9 +544,8 @@ class WishPaidDelegate(QStyledItemDelegate):
 
         model = index.model()
 
-        # --- このデリゲートは ShiftModel 専用。属性が無ければ何もしない ---
-        need_attrs = ("staffs", "days", "wishes", "wish_paid")
-        if any(not hasattr(model, a) for a in need_attrs):
+        # --- このデリゲートは ShiftModel 専用 ---
+        if not isinstance(model, ShiftModel):
             return
 
         row, col = index.row(), index.column()
@@ -204,16 +557,13 @@ class WishPaidDelegate(QStyledItemDelegate):
         day   = model.days[col]
 
         # 希望休かつ「有給希望」なら赤枠を描画
-        is_wish = model.wishes.get(staff, {}).get(day, False)
-        is_paid = model.wish_paid.get(staff, {}).get(day, False)
-        if is_wish and is_paid:
-            painter.save()
-            pen = QPen(QColor(220, 50, 47))  # 赤
-            pen.setWidth(2)
-            painter.setPen(pen)
-            rect = option.rect.adjusted(1, 1, -1, -1)
-            painter.drawRect(rect)
-            painter.restore()
+        if not model.wishes[staff][day] or not model.wish_paid[staff].get(day, False):
+            return
+        # ペンだけ差し替えて戻す（save/restore で全状態を退避しない）
+        old_pen = painter.pen()
+        painter.setPen(_PEN_PAID)
+        painter.drawRect(option.rect.adjusted(1, 1, -1, -1))
+        painter.setPen(old_pen)
 
 class ShiftModel(QAbstractTableModel):
     """スタッフ×日付の表。セルには "-", "出", "休", 休に有休フラグ(*) を付ける。"""
@@ -224,106 +574,164 @@ class ShiftModel(QAbstractTableModel):
         self.year = year
         self.month = month
         # status[name][day] = "-"/"出"/"休"/"休*"
-        self.status = {s.name: {d: " " for d in days} for s in staffs}
+        self.status: Dict[str, Dict[int, str]] = {}
         # wishes[name][day] = bool（希望休×）
-        self.wishes: Dict[str, Dict[int, bool]] = {s.name: {d: False for d in days} for s in staffs}
-        self.wish_paid: dict[str, dict[int, bool]] = {s.name: {d: False for d in self.days} for s in self.staffs}
+        self.wishes: Dict[str, Dict[int, bool]] = {}
+        self.wish_paid: dict[str, dict[int, bool]] = {}
         # leaders[day] = name or ""
-        self.leaders: Dict[int, str] = {d: "" for d in days}
+        self.leaders: Dict[int, str] = {}
+        self.req_min_work: dict[int, int] = {}
+        self._reset_cells()
         self.vac_days: dict[str, set] = {s.name: set() for s in staffs}
-        self.req_min_work: dict[int, int] = {d: 0 for d in self.days}
-        self.sat_days: set[int] = set()  # 土曜の「日」セット
-        self.hol_days: set[int] = set()  # 日祝の「日」セット（※日曜もここに含める）
+        self.sat_days: frozenset[int] = frozenset()  # 土曜の「日」セット
+        self.hol_days: frozenset[int] = frozenset()  # 日祝の「日」セット（※日曜もここに含める）
         self.paid_left: dict[str, int] = {s.name: 0 for s in self.staffs}
-        self.weekend_days: set[int] = set()  # 土日セット（分母用）
+        self.weekend_days: frozenset[int] = frozenset()  # 土日セット（分母用）
+        self._bulk_depth = 0
+        # 日ごとの休/出勤人数（トグル時に差分更新）
+        self._rest_count: dict[int, int] = {}
+        self._work_count: dict[int, int] = {}
+        self._weekend_rest: dict[str, int] = {}
+        self._resync_counts()
+        # ヘッダ文字列キャッシュ（再描画のたびに組み立て直さない）
+        self._weekday_str: list[str] = []
+        self._build_calendar()
+        self._h_cache: dict[int, str] = {}
+        self._v_cache: dict[int, str] = {}
+        self._v_prefix: dict[int, str] = {}  # 縦ヘッダ1行目（氏名＋残有給）
 
     # --- Qt model size ---
     def rowCount(self, parent=QModelIndex()):
         return len(self.staffs)
 
     def columnCount(self, parent=QModelIndex()) -> int:
-        return len(getattr(self, "days", []))
+        return len(self.days)
 
     # --- ヘッダ ---
     def headerData(self, section, orientation, role=Qt.DisplayRole):
+        # 表示文字列と配置以外のロールは扱わない
+        if role != Qt.DisplayRole and role != Qt.TextAlignmentRole:
+            return None
         if orientation == Qt.Horizontal:
             if section < 0 or section >= len(self.days):
                 return None
-            day = self.days[section]
             if role == Qt.DisplayRole:
-                # 曜日表記
-                import calendar
-                y = getattr(self, "year", None)
-                m = getattr(self, "month", None)
-                youbi = ""
-                if isinstance(y, int) and isinstance(m, int):
-                    # ShiftModel.headerData 内（曜日表記の直前あたり）
-                    yy, mm = (y, m) if day >= 16 else ((y + 1, 1) if m == 12 else (y, m + 1))
-                    wd = calendar.weekday(yy, mm, day)
-                    wk = "月火水木金土日"[wd]
-                    youbi = f"({wk})"
-
-                rest = self.count_rest_on_day(day)
-                need = int((getattr(self, "req_min_work", {}) or {}).get(day, 0))
-                work = self.count_work_on_day(day)
-                status = ""
-                if need > 0:
-                    status = "満" if work >= need else f"あと{need - work}人"
-                # 3行表示：日付(曜) / 休:N / （満 or あとX人）
-                return f"{day}{youbi}\n休:{rest}" + (f"\n{status}" if status else "")
+                text = self._h_cache.get(section)
+                if text is None:
+                    text = self._h_cache[section] = self._build_hheader(section)
+                return text
             if role == Qt.TextAlignmentRole:
                 return Qt.AlignCenter
 
         else:  # Qt.Vertical（スタッフ名の列）
             if role == Qt.DisplayRole:
                 if 0 <= section < len(self.staffs):
-                    name = self.staffs[section].name
-                    paid = int((getattr(self, "paid_left", {}) or {}).get(name, 0))
-                    num = self.weekend_rest_count(name)
-                    den = self.weekend_denominator()
-                    # 1行目：氏名（残有給を名前の横に）
-                    line1 = f"{name} (残有給{paid})"
-                    # 2行目：土日休暇数
-                    line2 = f"土日出勤{num}/{den}" if den else "0/0"
-                    return f"{line1}\n{line2}"
+                    text = self._v_cache.get(section)
+                    if text is None:
+                        text = self._v_cache[section] = self._build_vheader(section)
+                    return text
                 return ""
 
             if role == Qt.TextAlignmentRole:
                 return Qt.AlignVCenter | Qt.AlignLeft
 
-        return super().headerData(section, orientation, role)
+        return None
+
+    def _build_hheader(self, section: int) -> str:
+        day = self.days[section]
+        youbi = self._weekday_str[section] if section < len(self._weekday_str) else ""
+        work, rest = self._count_col(section)
+        need = int(self.req_min_work.get(day, 0))
+        status = ""
+        if need > 0:
+            status = "満" if work >= need else f"あと{need - work}人"
+        # 3行表示：日付(曜) / 休:N / （満 or あとX人）
+        return f"{day}{youbi}\n休:{rest}" + (f"\n{status}" if status else "")
+
+    def _build_vheader(self, section: int) -> str:
+        # 1行目：氏名（残有給を名前の横に）… 残有給が変わる（一括更新）まで使い回す
+        line1 = self._v_prefix.get(section)
+        if line1 is None:
+            name = self.staffs[section].name
+            paid = int(self.paid_left.get(name, 0))
+            line1 = self._v_prefix[section] = "".join((name, " (残有給", str(paid), ")\n"))
+        # 2行目：土日休暇数
+        den = self.weekend_denominator()
+        if not den:
+            return line1 + "0/0"
+        num = self.weekend_rest_count(self.staffs[section].name)
+        return "".join((line1, "土日出勤", str(num), "/", str(den)))
+
+    def _build_calendar(self):
+        """
+        期間の暦を1回の走査で作る：曜日表記 "(月)"・土曜/日曜/土日セット。
+        祝日は MainWindow._rebuild_period_maps が hol_days に追加する。
+        """
+        self._weekday_str = []
+        self.sat_days = self.hol_days = self.weekend_days = frozenset()
+        y, m = self.year, self.month
+        if not (isinstance(y, int) and isinstance(m, int)):
+            self._weekday_str = ["" for _ in self.days]
+            return
+        # 1回の走査でリストに振り分け、最後に frozenset にする（参照は in 判定だけ）
+        sat, sun = [], []
+        # 通常は期間の日並びそのままなので共有の plan を使う（違う並びの時だけその場で作る）
+        days = tuple(self.days)
+        plan = period_plan(y, m) if days == period_days(y, m) else build_period_plan(y, m, days)
+        for d, _yy, _mm, wd, _dt in plan:  # wd: 0=Mon ... 6=Sun
+            self._weekday_str.append(f"({'月火水木金土日'[wd]})")
+            if wd == 5:
+                sat.append(d)
+            elif wd == 6:
+                sun.append(d)
+        self.sat_days = frozenset(sat)
+        self.hol_days = frozenset(sun)
+        self.weekend_days = self.sat_days | self.hol_days
+
+    def _invalidate_header(self, col: int | None = None, row: int | None = None):
+        """ヘッダ文字列キャッシュを破棄する（引数なしなら全体）"""
+        if col is None and row is None:
+            self._h_cache.clear()
+            self._v_cache.clear()
+            self._v_prefix.clear()
+            return
+        if col is not None:
+            self._h_cache.pop(col, None)
+        if row is not None:
+            self._v_cache.pop(row, None)
 
     # --- データ表示 ---
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
         if not index.isValid():
             return None
+        # 扱うロール以外はセルを引かずに即返す（描画のたびに多数のロールで呼ばれる）
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole and role != Qt.BackgroundRole:
+            return None
+
         staff = self.staffs[index.row()].name
         day = self.days[index.column()]
-        s = self.status[staff][day]
         is_wish = self.wishes[staff][day]
-        is_wish_paid = self.wish_paid.get(staff, {}).get(day, False)
+        is_wish_paid = is_wish and self.wish_paid.get(staff, {}).get(day, False)
 
         if role == Qt.DisplayRole:
             if is_wish:
                 return "有" if is_wish_paid else ""  # ← 有給希望は「有」、通常の希望休は空文字
-            return s
-
-        if role == Qt.TextAlignmentRole:
-            return Qt.AlignCenter
-
-        if role == Qt.BackgroundRole:
-            # ① 希望休（通常のみオレンジ、有給希望はデフォルト色）
-            if is_wish and not is_wish_paid:
-                return QBrush(QColor(255, 140, 0))
-            # ② 長期休暇（水色帯）
-            if day in self.vac_days.get(staff, set()):
-                return QBrush(QColor(0, 170, 255, 80))
-            # ③ 週末/祝日（高コントラスト版）
-            if day in getattr(self, "hol_days", set()):
-                return QBrush(QColor(255, 130, 150, 160))  # 日曜・祝日：明るめピンク
-            if day in getattr(self, "sat_days", set()):
-                return QBrush(QColor(70, 170, 255, 160))  # 土曜：明るめシアン
+            return self.status[staff][day]
 
+        # Qt.BackgroundRole
+        # ① 希望休（通常のみオレンジ、有給希望はデフォルト色）
+        if is_wish and not is_wish_paid:
+            return _BRUSH_WISH
+        # ② 長期休暇（水色帯）
+        if day in self.vac_days.get(staff, set()):
+            return _BRUSH_VAC
+        # ③ 週末/祝日（高コントラスト版）
+        if day in self.hol_days:
+            return _BRUSH_HOL  # 日曜・祝日：明るめピンク
+        if day in self.sat_days:
+            return _BRUSH_SAT  # 土曜：明るめシアン
         return None
 
     # --- 編集（クリックでトグル） ---
@@ -346,8 +754,11 @@ class ShiftModel(QAbstractTableModel):
 
         nxt = STATUS_ORDER[(idx + 1) % len(STATUS_ORDER)]
         self.status[staff][day] = nxt  # 有休フラグはリセットされる（"休*" → "休" → ...）
+        self._apply_count_delta(staff, day, cur, nxt)
+        self._invalidate_header(col=col, row=row)
 
-        self.dataChanged.emit(self.index(row, col), self.index(row, col))
+        idx = self.index(row, col)
+        self.dataChanged.emit(idx, idx, [Qt.DisplayRole, Qt.BackgroundRole])
         self.headerDataChanged.emit(Qt.Horizontal, col, col)
         self.headerDataChanged.emit(Qt.Vertical, row, row)
 
@@ -366,9 +777,11 @@ class ShiftModel(QAbstractTableModel):
             self.status[staff][day] = "休"
         else:
             return  # 出勤（" "）などは対象外
+        self._invalidate_header(col=col, row=row)
 
         # 反映
-        self.dataChanged.emit(self.index(row, col), self.index(row, col))
+        idx = self.index(row, col)
+        self.dataChanged.emit(idx, idx, [Qt.DisplayRole, Qt.BackgroundRole])
         self.headerDataChanged.emit(Qt.Horizontal, col, col)
         self.headerDataChanged.emit(Qt.Vertical, row, row)  # ★ 追加
 
@@ -376,7 +789,8 @@ class ShiftModel(QAbstractTableModel):
         staff = self.staffs[row].name
         day = self.days[col]
         self.wishes[staff][day] = not self.wishes[staff][day]
-        self.dataChanged.emit(self.index(row, col), self.index(row, col))
+        idx = self.index(row, col)
+        self.dataChanged.emit(idx, idx, [Qt.DisplayRole, Qt.BackgroundRole])
 
     def toggle_wish_cycle(self, row: int, col: int):
         """希望休モード：未指定 → 希望休 → 有給希望 → 解除 の三段階"""
@@ -401,18 +815,43 @@ class ShiftModel(QAbstractTableModel):
             # 有給希望 → 解除
             self.wishes[staff][day] = False
             self.wish_paid[staff][day] = False
+        self._invalidate_header(col=col)
 
         # 反映
-        self.dataChanged.emit(self.index(row, col), self.index(row, col))
+        idx = self.index(row, col)
+        self.dataChanged.emit(idx, idx, [Qt.DisplayRole, Qt.BackgroundRole])
         self.headerDataChanged.emit(Qt.Horizontal, col, col)
 
     def count_rest_on_day(self, day: int) -> int:
-        cnt = 0
+        return self._rest_count.get(day, 0)
+
+    def _count_col(self, col: int) -> tuple[int, int]:
+        """列（日）の (出勤人数, 休人数)。どちらも _resync_counts の1回の走査で数えてある"""
+        day = self.days[col]
+        return self._work_count.get(day, 0), self._rest_count.get(day, 0)
+
+    def _resync_counts(self):
+        """日ごとの休/出勤人数カウンタを status から数え直す（一括更新後に呼ぶ）"""
+        self._rest_count = {d: 0 for d in self.days}
+        self._work_count = {d: 0 for d in self.days}
+        self._weekend_rest = {}
         for s in self.staffs:
-            v = self.status[s.name][day]
-            if v in ("休", "休*"):
-                cnt += 1
-        return cnt
+            row = self.status.get(s.name, {})
+            for d in self.days:
+                v = row.get(d)
+                if v == " ":
+                    self._work_count[d] += 1
+                elif v in REST_STATUSES:
+                    self._rest_count[d] += 1
+            self._weekend_rest[s.name] = sum(1 for d in self.weekend_days if row.get(d) in REST_STATUSES)
+
+    def _apply_count_delta(self, name: str, day: int, old: str, new: str):
+        """1セルの変更ぶんだけカウンタを増減する"""
+        d_rest = (new in REST_STATUSES) - (old in REST_STATUSES)
+        self._rest_count[day] += d_rest
+        self._work_count[day] += (new == " ") - (old == " ")
+        if day in self.weekend_days:
+            self._weekend_rest[name] = self._weekend_rest.get(name, 0) + d_rest
 
     # --- JSON入出力 ---
     def to_json(self) -> Dict:
@@ -420,21 +859,24 @@ class ShiftModel(QAbstractTableModel):
             'year': self.year,
             'month': self.month,
             'days': self.days,
+            # int の日キーは save_json（orjson / json どちらでも）が文字列キーとして書き出す
             'status': self.status,
-            'wishes': {k: {str(d): v for d, v in days.items()} for k, days in self.wishes.items()},
-            'wish_paid': {k: {str(d): v for d, v in days.items()} for k, days in self.wish_paid.items()},  # ★追加
-            'leaders': {str(d): name for d, name in self.leaders.items()}
+            'wishes': self.wishes,
+            'wish_paid': self.wish_paid,  # ★追加
+            'leaders': self.leaders,
         }
 
     def from_json(self, obj: Dict):
-        self.beginResetModel()
-        self.status = obj.get('status', self.status)
+        self.begin_bulk_update()
+        st = obj.get('status')
+        if isinstance(st, dict):
+            self.status = {name: {int(d): v for d, v in daymap.items()} for name, daymap in st.items()}
         w = obj.get('wishes', {})
         self.wishes = {name: {int(d): v for d, v in daymap.items()} for name, daymap in w.items()}
         wp = obj.get('wish_paid', {})
         self.wish_paid = {name: {int(d): v for d, v in daymap.items()} for name, daymap in wp.items()}
         self.leaders = {int(d): nm for d, nm in obj.get('leaders', {}).items()}
-        self.endResetModel()
+        self.end_bulk_update()
 
     def flags(self, index):
         if not index.isValid():
@@ -450,11 +892,11 @@ class ShiftModel(QAbstractTableModel):
         return Qt.ItemIsEnabled | Qt.ItemIsSelectable
 
     def count_work_on_day(self, day: int) -> int:
-        return sum(1 for s in self.staffs if self.status[s.name][day] == " ")
+        return self._work_count.get(day, 0)
 
     def weekend_rest_count(self, name: str) -> int:
-        # 分子：土日で「休 or 休*」の日数
-        return sum(1 for d in self.weekend_days if self.status[name][d] in ("休", "休*"))
+        # 分子：土日で「休 or 休*」の日数（トグル時に差分更新）
+        return self._weekend_rest.get(name, 0)
 
     def weekend_denominator(self) -> int:
         # 分母：期間内の土日の日数
@@ -477,11 +919,39 @@ class ShiftModel(QAbstractTableModel):
 
     # ShiftModel に追加
     def set_period(self, year: int, month: int, days: list):
-        self.beginResetModel()
+        self.begin_bulk_update()
         self.year = year
         self.month = month
         self.days = list(days)
-        self.endResetModel()
+        # 列（日）が変わるのでセル単位のデータは空で作り直す
+        self._reset_cells()
+        self._build_calendar()
+        self.end_bulk_update()
+
+    def _reset_cells(self):
+        """セル単位のデータ（status / wishes / wish_paid / leaders / req_min_work）を現在の days で空にする"""
+        days = self.days
+        self.status = {s.name: dict.fromkeys(days, " ") for s in self.staffs}
+        self.wishes = {s.name: dict.fromkeys(days, False) for s in self.staffs}
+        self.wish_paid = {s.name: dict.fromkeys(days, False) for s in self.staffs}
+        self.leaders = dict.fromkeys(days, "")
+        self.req_min_work = dict.fromkeys(days, 0)
+
+    def begin_bulk_update(self):
+        """
+        複数の属性（status / req_min_work / paid_left / 土日祝セット 等）をまとめて差し替える前に呼ぶ。
+        入れ子可。最も外側の end_bulk_update でカウンタ/ヘッダを作り直し、ビューへは1回だけ通知する。
+        """
+        if self._bulk_depth == 0:
+            self.beginResetModel()
+        self._bulk_depth += 1
+
+    def end_bulk_update(self):
+        self._bulk_depth -= 1
+        if self._bulk_depth == 0:
+            self._resync_counts()
+            self._invalidate_header()
+            self.endResetModel()
 
 # ---------- ビュー（テーブル） ----------
 
@@ -490,7 +960,8 @@ class ShiftTable(QTableView):
         super().__init__()
         self.setModel(model)
         self.wish_mode_getter = wish_mode_getter
-        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # 行高は固定（ResizeToContents だとリセットのたびに全セルを測る）。高さはフォントから _fit_row_height で決める
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         # スクロール設定
         self.setHorizontalScrollMode(QTableView.ScrollPerPixel)
@@ -505,6 +976,25 @@ class ShiftTable(QTableView):
         self.setSelectionMode(QTableView.NoSelection)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.on_context)
+        # リセット（期間切替/読込）のたびに1回だけ測り直し、以降は Fixed のまま
+        model.modelReset.connect(self._fit_row_height)
+        self._fit_row_height()
+
+    def _fit_row_height(self):
+        """縦ヘッダ2行（氏名/土日出勤）＋スタイルシートの上下 padding(6px×2)＋枠線が収まる行高にする"""
+        vh = self.verticalHeader()
+        vh.ensurePolished()  # スタイルシートのフォントを反映させてから測る
+        h = vh.fontMetrics().lineSpacing() * 2 + 12 + 2
+        # 行があれば実際のヘッダ内容（全行とも2行表示）でも測り、大きい方を使う
+        if self.model() is not None and self.model().rowCount() > 0:
+            h = max(h, vh.sectionSizeFromContents(0).height())
+        if vh.defaultSectionSize() != h:
+            vh.setDefaultSectionSize(h)
+
+    def showEvent(self, event):
+        # 表示時にフォントが確定するので測り直す（同じ値なら何もしない）
+        self._fit_row_height()
+        super().showEvent(event)
 
     def sizeHint(self):
         return QSize(1100, 600)
@@ -531,8 +1021,106 @@ class ShiftTable(QTableView):
         m.addAction(act_paid)
         m.exec(self.viewport().mapToGlobal(pos))
 
+# ---------- 共通デリゲート ----------
+
+class SpinBoxDelegate(QStyledItemDelegate):
+    """
+    指定列だけスピンボックスを編集時に生成する（表示中のセルにウィジェットは持たない）。
+    spin_max: 列 -> 上限（下限は 0）
+    """
+    def __init__(self, spin_max: dict[int, int], parent=None):
+        super().__init__(parent)
+        self.spin_max = dict(spin_max)
+
+    def createEditor(self, parent, option, index):
+        top = self.spin_max.get(index.column())
+        if top is not None:
+            sp = QSpinBox(parent)
+            sp.setRange(0, top)
+            return sp
+        return super().createEditor(parent, option, index)
+
+    def setEditorData(self, editor, index):
+        if index.column() in self.spin_max:
+            editor.setValue(int(index.data(Qt.EditRole) or 0))
+            return
+        super().setEditorData(editor, index)
+
+    def setModelData(self, editor, model, index):
+        if index.column() in self.spin_max:
+            editor.interpretText()
+            model.setData(index, editor.value(), Qt.EditRole)
+            return
+        super().setModelData(editor, model, index)
+
 # ---------- メンバー管理ダイアログ ----------
 
+class MembersModel(QAbstractTableModel):
+    """メンバー一覧（氏名 / 管理職 / 残有給）。行は {"name", "is_manager", "paid_left"} の dict"""
+    HEADERS = ["氏名", "役職(管理職)", "残有給"]
+
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self.rows: list[dict] = list(rows or [])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 1:
+            return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = self.rows[index.row()], index.column()
+        if col == 0 and role in (Qt.DisplayRole, Qt.EditRole):
+            return row["name"]
+        if col == 1 and role == Qt.CheckStateRole:
+            return Qt.Checked if row["is_manager"] else Qt.Unchecked
+        if col == 2 and role in (Qt.DisplayRole, Qt.EditRole):
+            return row["paid_left"]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row, col = self.rows[index.row()], index.column()
+        if col == 0 and role == Qt.EditRole:
+            row["name"] = str(value)
+        elif col == 1 and role == Qt.CheckStateRole:
+            row["is_manager"] = Qt.CheckState(value) == Qt.Checked
+        elif col == 2 and role == Qt.EditRole:
+            row["paid_left"] = int(value or 0)
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def append_row(self, row: dict):
+        r = len(self.rows)
+        self.beginInsertRows(QModelIndex(), r, r)
+        self.rows.append(row)
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        for r in sorted(set(rows), reverse=True):
+            self.beginRemoveRows(QModelIndex(), r, r)
+            del self.rows[r]
+            self.endRemoveRows()
+
+
 class MembersDialog(QDialog):
     """メンバー管理（氏名 / 管理職 / 入職日）を表で編集して保存"""
     def __init__(self, parent=None, members_path=None, staffs_path=None):
@@ -543,8 +1131,10 @@ class MembersDialog(QDialog):
         self.staffs_path = staffs_path
 
         v = QVBoxLayout(self)
-        self.table = QTableWidget(0, 3, self)
-        self.table.setHorizontalHeaderLabels(["氏名", "役職(管理職)", "残有給"])
+        self.model = MembersModel(parent=self)
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(SpinBoxDelegate({2: 99}, self.table))  # 残有給
         self.table.verticalHeader().setVisible(False)
         vh = self.table.verticalHeader()
         vh.setDefaultSectionSize(32)  # 30〜36程度に
@@ -562,7 +1152,7 @@ class MembersDialog(QDialog):
         self.buttons = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
         v.addWidget(self.buttons)
 
-        btn_add.clicked.connect(self.add_row)
+        btn_add.clicked.connect(lambda: self.add_row())
         btn_del.clicked.connect(self.del_rows)
         self.buttons.accepted.connect(self.save_and_close)
         self.buttons.rejected.connect(self.reject)
@@ -577,44 +1167,177 @@ class MembersDialog(QDialog):
         ]}
         ensure_file_with_template(self.members_path, template)
         obj = load_json(self.members_path, template)
-        for m in obj.get("members", []):
+        # 後方互換：list でも dict でもOKに
+        members = obj if isinstance(obj, list) else obj.get("members", [])
+        for m in members:
             self.add_row(m.get("name",""), bool(m.get("is_manager", False)), int(m.get("paid_left", 0)))
 
     def add_row(self, name="", is_manager=False, paid_left=0):
-        r = self.table.rowCount()
-        self.table.insertRow(r)
-        # 氏名
-        self.table.setItem(r, 0, QTableWidgetItem(name))
-        # 管理職チェック
-        item_mgr = QTableWidgetItem()
-        item_mgr.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        item_mgr.setCheckState(Qt.Checked if is_manager else Qt.Unchecked)
-        self.table.setItem(r, 1, item_mgr)
-        # 残有給（スピン）
-        sp = QSpinBox(self);
-        sp.setRange(0, 99);
-        sp.setValue(int(paid_left or 0))
-        self.table.setCellWidget(r, 2, sp)
+        self.model.append_row({"name": name, "is_manager": bool(is_manager), "paid_left": int(paid_left or 0)})
 
     def del_rows(self):
-        for r in sorted({i.row() for i in self.table.selectedIndexes()}, reverse=True):
-            self.table.removeRow(r)
+        self.model.remove_rows(i.row() for i in self.table.selectionModel().selectedRows())
 
     # 修正後
     def save_and_close(self):
+        # 編集中のセルがあれば確定させてから保存
+        self.table.setCurrentIndex(QModelIndex())
         data = []
-        for r in range(self.table.rowCount()):
-            name = (self.table.item(r, 0).text().strip() if self.table.item(r, 0) else "")
-            is_mgr = (self.table.item(r, 1).checkState() == Qt.Checked) if self.table.item(r, 1) else False
-            sp = self.table.cellWidget(r, 2)
-            paid_left = int(sp.value()) if sp else 0
+        for row in self.model.rows:
+            name = (row["name"] or "").strip()
             if name:
-                data.append({"name": name, "is_manager": is_mgr, "paid_left": paid_left})
+                data.append({"name": name, "is_manager": row["is_manager"], "paid_left": row["paid_left"]})
         save_json(self.members_path, {"members": data})
         save_json(self.staffs_path, data)
         self.accept()
 
 # ---------- 長期休暇管理ダイアログ ----------
+
+class LongVacationModel(QAbstractTableModel):
+    """
+    長期休暇の一覧。行は保存形式と同じ dict:
+    {"member", "name", "start", "end", "days", "paid_cap", "paid_used"}（start/end は ISO 文字列）
+    """
+    HEADERS = ["氏名", "休暇名", "開始日", "終了日", "日数", "有給上限", "有給使用"]
+    _KEYS = ("member", "name", "start", "end", "days", "paid_cap", "paid_used")
+    EDITABLE_COLS = (0, 1, 2, 3, 6)
+
+    # 終了日の変更で14日を超えたため補正した
+    span_exceeded = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows: list[dict] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() in self.EDITABLE_COLS:
+            return Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self.rows[index.row()][self._KEYS[index.column()]]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole or index.column() not in self.EDITABLE_COLS:
+            return False
+        r, col = index.row(), index.column()
+        row = self.rows[r]
+        exceeded = False
+        if col in (0, 1):
+            row[self._KEYS[col]] = str(value)
+        elif col == 2:
+            row["start"] = value
+            self._recalc(row, clamp_end=False)
+        elif col == 3:
+            row["end"] = value
+            exceeded = self._recalc(row, clamp_end=True)
+        else:
+            row["paid_used"] = max(0, min(int(value or 0), row["paid_cap"]))
+        # 日付を変えると日数/上限/使用数も変わるので行の右側までまとめて通知
+        self.dataChanged.emit(index, self.index(r, len(self.HEADERS) - 1))
+        if exceeded:
+            self.span_exceeded.emit()
+        return True
+
+    @staticmethod
+    def _recalc(row: dict, clamp_end: bool) -> bool:
+        """日数・有給上限を再計算。clamp_end なら14日超過時に終了日を開始日+13へ補正し True を返す"""
+        d0 = date.fromisoformat(row["start"])
+        d1 = date.fromisoformat(row["end"])
+        # 終了<開始は開始日に合わせる（無警告）
+        if d1 < d0:
+            d1 = d0
+            row["end"] = d1.isoformat()
+        days = (d1 - d0).days + 1
+        exceeded = False
+        if days > 14:
+            if clamp_end:
+                # 終了日を開始日+13に補正（=14日間）
+                row["end"] = (d0 + timedelta(days=13)).isoformat()
+                exceeded = True
+            days = 14
+        row["days"] = days
+        row["paid_cap"] = days // 2
+        row["paid_used"] = min(row["paid_used"], row["paid_cap"])
+        return exceeded
+
+    def append_row(self, row: dict):
+        self._recalc(row, clamp_end=False)
+        r = len(self.rows)
+        self.beginInsertRows(QModelIndex(), r, r)
+        self.rows.append(row)
+        self.endInsertRows()
+
+    def remove_rows(self, rows):
+        for r in sorted(set(rows), reverse=True):
+            self.beginRemoveRows(QModelIndex(), r, r)
+            del self.rows[r]
+            self.endRemoveRows()
+
+
+class LongVacationDelegate(QStyledItemDelegate):
+    """氏名コンボ / 日付 / 有給使用スピンを編集時にだけ生成する"""
+    def __init__(self, member_names, parent=None):
+        super().__init__(parent)
+        self.member_names = member_names
+
+    def createEditor(self, parent, option, index):
+        col = index.column()
+        if col == 0:
+            cb = QComboBox(parent)
+            cb.addItems(self.member_names)
+            return cb
+        if col in (2, 3):
+            de = QDateEdit(parent)
+            de.setCalendarPopup(True)
+            return de
+        if col == 6:
+            return QSpinBox(parent)
+        return super().createEditor(parent, option, index)
+
+    def setEditorData(self, editor, index):
+        col = index.column()
+        value = index.data(Qt.EditRole)
+        if col == 0:
+            idx = editor.findText(value or "")
+            if idx >= 0:
+                editor.setCurrentIndex(idx)
+        elif col in (2, 3):
+            editor.setDate(qdate_from_iso(value))
+        elif col == 6:
+            editor.setRange(0, int(index.sibling(index.row(), 5).data(Qt.EditRole) or 0))
+            editor.setValue(int(value or 0))
+        else:
+            super().setEditorData(editor, index)
+
+    def setModelData(self, editor, model, index):
+        col = index.column()
+        if col == 0:
+            model.setData(index, editor.currentText(), Qt.EditRole)
+        elif col in (2, 3):
+            model.setData(index, editor.date().toString('yyyy-MM-dd'), Qt.EditRole)
+        elif col == 6:
+            editor.interpretText()
+            model.setData(index, editor.value(), Qt.EditRole)
+        else:
+            super().setModelData(editor, model, index)
+
+
 class LongVacationDialog(QDialog):
     """長期休暇管理（最大14日・有給は50%まで）"""
     def __init__(self, parent=None, vacations_path=None, member_names=None):
@@ -625,10 +1348,13 @@ class LongVacationDialog(QDialog):
         self.member_names = member_names or []
 
         v = QVBoxLayout(self)
-        self.table = QTableWidget(0, 7, self)
-        self.table.setHorizontalHeaderLabels(["氏名", "休暇名", "開始日", "終了日", "日数", "有給上限", "有給使用"])
+        self.model = LongVacationModel(self)
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(LongVacationDelegate(self.member_names, self.table))
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.AllEditTriggers)
         v.addWidget(self.table, 1)
 
         hb = QHBoxLayout()
@@ -642,11 +1368,14 @@ class LongVacationDialog(QDialog):
         self.buttons = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
         v.addWidget(self.buttons)
 
-        btn_add.clicked.connect(self.add_row)
+        btn_add.clicked.connect(lambda: self.add_row())
         btn_del.clicked.connect(self.del_rows)
         self.buttons.accepted.connect(self.save_and_close)
         self.buttons.rejected.connect(self.reject)
 
+        self._lv_warn_lock = False
+        self.model.span_exceeded.connect(self._on_span_exceeded)
+
         template = {"vacations": []}
         ensure_file_with_template(self.vacations_path, template)
         obj = load_json(self.vacations_path, template)
@@ -659,114 +1388,51 @@ class LongVacationDialog(QDialog):
                 paid_used=int(vobj.get("paid_used", 0)),
             )
 
-    def _mk_member_cb(self, selected=""):
-        cb = QComboBox(self)
-        cb.addItems(self.member_names)
-        if selected:
-            idx = cb.findText(selected)
-            if idx >= 0:
-                cb.setCurrentIndex(idx)
-        return cb
-
-    def _mk_date(self, iso_str: str | None):
-        de = QDateEdit(self); de.setCalendarPopup(True)
+    @staticmethod
+    def _iso_or_today(iso_str: str | None) -> str:
         if iso_str:
             try:
-                y, m, d = map(int, iso_str.split("-"))
-                de.setDate(date(y, m, d))
+                return date.fromisoformat(iso_str).isoformat()
             except Exception:
-                de.setDate(date.today())
-        else:
-            de.setDate(date.today())
-        return de
+                pass
+        return date.today().isoformat()
 
     def add_row(self, staff="", title="", start=None, end=None, paid_used=0):
-        r = self.table.rowCount()
-        self.table.insertRow(r)
-        self.table.setCellWidget(r, 0, self._mk_member_cb(staff))
-        self.table.setItem(r, 1, QTableWidgetItem(title))
-        de_start = self._mk_date(start)
-        de_end = self._mk_date(end)
-        self.table.setCellWidget(r, 2, de_start)
-        self.table.setCellWidget(r, 3, de_end)
-        self.table.setItem(r, 4, QTableWidgetItem("0"))
-        self.table.setItem(r, 5, QTableWidgetItem("0"))
-        sp_paid = QSpinBox(self)
-        sp_paid.setRange(0, 0)
-        self.table.setCellWidget(r, 6, sp_paid)
-
-        if not hasattr(self, "_lv_warn_lock"):
-            self._lv_warn_lock = False
-
-        def on_date_changed(show_warning: bool):
-            d0 = de_start.date().toPython() if hasattr(de_start.date(), 'toPython') else date.fromisoformat(de_start.date().toString('yyyy-MM-dd'))
-            d1 = de_end.date().toPython()   if hasattr(de_end.date(),   'toPython') else date.fromisoformat(de_end.date().toString('yyyy-MM-dd'))
-
-            # 終了<開始は開始日に合わせる（無警告）
-            if d1 < d0:
-                with QSignalBlocker(de_end):
-                    de_end.setDate(d0)
-                d1 = d0
-
-            days = (d1 - d0).days + 1
-            if days > 14:
-                if show_warning and not self._lv_warn_lock:
-                    # ここで“この操作中は1回だけ”にロック
-                    self._lv_warn_lock = True
-                    QMessageBox.warning(self, "エラー", "長期休暇は最大14日までです。")
-                    # 終了日を開始日+13に補正（=14日間）※再発火はブロック
-                    with QSignalBlocker(de_end):
-                        de_end.setDate(d0 + timedelta(days=13))
-                    # すぐロック解除すると再入でまた鳴ることがあるので、イベントループ1周後に解除
-                    QTimer.singleShot(0, lambda: setattr(self, "_lv_warn_lock", False))
-                # days を14に固定
-                days = 14
-
-            paid_cap = days // 2
-            self.table.item(r, 4).setText(str(days))
-            self.table.item(r, 5).setText(str(paid_cap))
-            sp_paid.setMaximum(paid_cap)
-            if sp_paid.value() > paid_cap:
-                sp_paid.setValue(paid_cap)
-
-        def on_start_changed():
-            # 開始日を動かしたときは無警告で補正・再計算のみ
-            on_date_changed(show_warning=False)
-
-        def on_end_changed():
-            # 終了日を動かしたときだけ、上限超過で警告を出す
-            on_date_changed(show_warning=True)
+        # 氏名未指定なら先頭メンバー（コンボの初期選択と同じ）
+        if not staff and self.member_names:
+            staff = self.member_names[0]
+        self.model.append_row({
+            "member": staff, "name": title,
+            "start": self._iso_or_today(start), "end": self._iso_or_today(end),
+            "days": 0, "paid_cap": 0, "paid_used": int(paid_used or 0),
+        })
 
-        # 接続を分ける（※ 以前の on_date_changed 接続は削除）
-        de_start.userDateChanged.connect(on_start_changed)
-        de_end.userDateChanged.connect(on_end_changed)
+    def _on_span_exceeded(self):
+        # 編集確定の最中に重ねて出さないよう、“この操作中は1回だけ”イベントループ1周後に警告
+        if self._lv_warn_lock:
+            return
+        self._lv_warn_lock = True
 
-        # 初期計算
-        on_date_changed(show_warning=False)
-        sp_paid.setValue(min(paid_used, sp_paid.maximum()))
+        def _warn():
+            QMessageBox.warning(self, "エラー", "長期休暇は最大14日までです。")
+            self._lv_warn_lock = False
+        QTimer.singleShot(0, _warn)
 
     def del_rows(self):
-        for r in sorted({i.row() for i in self.table.selectedIndexes()}, reverse=True):
-            self.table.removeRow(r)
+        self.model.remove_rows(i.row() for i in self.table.selectionModel().selectedRows())
 
     # LongVacationDialog 内
     def save_and_close(self):
+        # 編集中のセルがあれば確定させてから保存
+        self.table.setCurrentIndex(QModelIndex())
         out = []
-        for r in range(self.table.rowCount()):
-            cb = self.table.cellWidget(r, 0)  # 氏名コンボ
-            de0 = self.table.cellWidget(r, 2)  # 開始 QDateEdit
-            de1 = self.table.cellWidget(r, 3)  # 終了 QDateEdit
-            sp = self.table.cellWidget(r, 6)  # 有給 QSpinBox
-
-            name = cb.currentText() if cb else ""
-            title_item = self.table.item(r, 1)
-            title = title_item.text().strip() if title_item else ""
-            d0 = (de0.date().toPython() if hasattr(de0.date(), 'toPython')
-                  else date.fromisoformat(de0.date().toString('yyyy-MM-dd')))
-            d1 = (de1.date().toPython() if hasattr(de1.date(), 'toPython')
-                  else date.fromisoformat(de1.date().toString('yyyy-MM-dd')))
+        for row in self.model.rows:
+            name = row["member"]
+            title = (row["name"] or "").strip()
+            d0 = date.fromisoformat(row["start"])
+            d1 = date.fromisoformat(row["end"])
             days = (d1 - d0).days + 1
-            paid_used = sp.value() if sp else 0
+            paid_used = row["paid_used"]
 
             if not name or not title:
                 continue
@@ -791,13 +1457,6 @@ class LongVacationDialog(QDialog):
             QMessageBox.critical(self, "保存エラー", f"長期休暇データの保存に失敗しました。\n{self.vacations_path}\n{e}")
             return
 
-        # 保存検証：直後に読み直して件数を確認
-        try:
-            load_json(self.vacations_path, {"vacations": []})
-        except Exception:
-            # 読み直し失敗しても保存は継続
-            pass
-
         self.accept()
 
 class SpecialQuotaDialog(QDialog):
@@ -861,38 +1520,34 @@ class SpecialQuotaDialog(QDialog):
 
     def _load_or_init(self):
         tmpl = {"periods": []}
-        ensure_file_with_template(self.path, tmpl)
-        obj = load_json(self.path, tmpl)
+        obj, found = try_load_json(self.path, tmpl)
+        if not found:
+            save_json(self.path, tmpl)
         return obj if isinstance(obj, dict) else tmpl
 
     def _rebuild_periods(self):
+        self.cb_periods.setUpdatesEnabled(False)
         self.cb_periods.blockSignals(True)
-        self.cb_periods.clear()
-        for p in self.data.get("periods", []):
-            self.cb_periods.addItem(p.get("name", "（無題）"))
-        self.cb_periods.blockSignals(False)
+        try:
+            self.cb_periods.clear()
+            self.cb_periods.addItems([p.get("name", "（無題）") for p in self.data.get("periods", [])])
+        finally:
+            self.cb_periods.blockSignals(False)
+            self.cb_periods.setUpdatesEnabled(True)
 
     def _load_ui(self, idx: int):
         if not (0 <= idx < len(self.data.get("periods", []))):
             return
         p = self.data["periods"][idx]
         self.ed_name.setText(p.get("name", ""))
-        try:
-            y,m,d = map(int, (p.get("start","") or date.today().isoformat()).split("-"))
-            self.de_start.setDate(date(y,m,d))
-        except Exception:
-            self.de_start.setDate(date.today())
-        try:
-            y,m,d = map(int, (p.get("end","") or date.today().isoformat()).split("-"))
-            self.de_end.setDate(date(y,m,d))
-        except Exception:
-            self.de_end.setDate(date.today())
+        self.de_start.setDate(qdate_from_iso(p.get("start")))
+        self.de_end.setDate(qdate_from_iso(p.get("end")))
         self.sp_min.setValue(int(p.get("min_work", 0)))
 
     def _read_ui(self) -> dict:
         name = self.ed_name.text().strip() or "（無題）"
-        d0 = self.de_start.date().toPython() if hasattr(self.de_start.date(), 'toPython') else date.fromisoformat(self.de_start.date().toString('yyyy-MM-dd'))
-        d1 = self.de_end.date().toPython()   if hasattr(self.de_end.date(),   'toPython') else date.fromisoformat(self.de_end.date().toString('yyyy-MM-dd'))
+        d0 = qdate_to_date(self.de_start.date())
+        d1 = qdate_to_date(self.de_end.date())
         if d1 < d0:
             d1 = d0
         return {"name": name, "start": d0.isoformat(), "end": d1.isoformat(), "min_work": int(self.sp_min.value())}
@@ -933,6 +1588,76 @@ class SpecialQuotaDialog(QDialog):
 
 
 # ---------- 曜日ごとの設定（基本）ダイアログ ----------
+class WeekdayRulesModel(QAbstractTableModel):
+    """曜日ごとの基本ルール（7行固定）。行は {"min_work", "min_managers", "leader_required"} の dict（行番号=曜日 0=月）"""
+    HEADERS = ["曜日", "必要出勤数", "管理職最少", "リーダー必須"]
+    YOUBI = ["月", "火", "水", "木", "金", "土", "日"]
+    _KEYS = (None, "min_work", "min_managers", "leader_required")
+    # スピンボックスで編集する列 -> 上限
+    SPIN_MAX = {1: 99, 2: 10}
+
+    def __init__(self, rules: dict | None = None, parent=None):
+        super().__init__(parent)
+        rules = rules or {}
+        self.rows: list[dict] = []
+        for wd in range(7):
+            rule = rules.get(str(wd), {})
+            self.rows.append({
+                "min_work": int(rule.get("min_work", 0)),
+                "min_managers": int(rule.get("min_managers", 0)),
+                "leader_required": bool(rule.get("leader_required", False)),
+            })
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        col = index.column()
+        if col == 0:
+            return Qt.ItemIsSelectable | Qt.ItemIsEnabled  # 曜日名は編集不可表示
+        if col == 3:
+            return Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r, col = index.row(), index.column()
+        if col == 0 and role == Qt.DisplayRole:
+            return self.YOUBI[r]
+        if col in self.SPIN_MAX and role in (Qt.DisplayRole, Qt.EditRole):
+            return self.rows[r][self._KEYS[col]]
+        if col == 3 and role == Qt.CheckStateRole:
+            return Qt.Checked if self.rows[r]["leader_required"] else Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        r, col = index.row(), index.column()
+        if col in self.SPIN_MAX and role == Qt.EditRole:
+            self.rows[r][self._KEYS[col]] = max(0, min(int(value or 0), self.SPIN_MAX[col]))
+        elif col == 3 and role == Qt.CheckStateRole:
+            self.rows[r]["leader_required"] = Qt.CheckState(value) == Qt.Checked
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def to_rules(self) -> dict:
+        return {str(wd): dict(row) for wd, row in enumerate(self.rows)}
+
+
 class WeekdayRulesDialog(QDialog):
     """曜日ごとの設定（基本）：最小構成のGUI"""
     def __init__(self, parent=None, rules_path=None):
@@ -941,68 +1666,30 @@ class WeekdayRulesDialog(QDialog):
         self.resize(560, 360)
         self.rules_path = rules_path
 
+        # ロード
+        template = WEEKDAY_RULES_TEMPLATE
+        ensure_file_with_template(self.rules_path, template)
+        obj = load_json(self.rules_path, template)
+
         v = QVBoxLayout(self)
-        self.table = QTableWidget(7, 4, self)
-        self.table.setHorizontalHeaderLabels(["曜日", "必要出勤数", "管理職最少", "リーダー必須"])
+        self.model = WeekdayRulesModel(obj.get("weekday_rules", {}), parent=self)
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(SpinBoxDelegate(WeekdayRulesModel.SPIN_MAX, self.table))
         self.table.verticalHeader().setVisible(False)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.AllEditTriggers)
         v.addWidget(self.table, 1)
 
-        # 行ヘッダ（曜日名）
-        youbi = ["月","火","水","木","金","土","日"]
-        for r, yb in enumerate(youbi):
-            self.table.setItem(r, 0, QTableWidgetItem(yb))
-            self.table.item(r, 0).setFlags(Qt.ItemIsSelectable)  # 編集不可表示
-
-            sp_need = QSpinBox(self); sp_need.setRange(0, 99)
-            sp_mgr  = QSpinBox(self); sp_mgr.setRange(0, 10)
-            cb_lead = QCheckBox(self)
-            self.table.setCellWidget(r, 1, sp_need)
-            self.table.setCellWidget(r, 2, sp_mgr)
-            self.table.setCellWidget(r, 3, cb_lead)
-
         self.buttons = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
         v.addWidget(self.buttons)
         self.buttons.accepted.connect(self.save_and_close)
         self.buttons.rejected.connect(self.reject)
 
-        # ロード
-        template = {
-            "weekday_rules": {
-                "0": {"min_work": 5, "min_managers": 1, "leader_required": True},
-                "1": {"min_work": 5, "min_managers": 1, "leader_required": True},
-                "2": {"min_work": 5, "min_managers": 1, "leader_required": True},
-                "3": {"min_work": 5, "min_managers": 1, "leader_required": True},
-                "4": {"min_work": 5, "min_managers": 1, "leader_required": True},
-                "5": {"min_work": 6, "min_managers": 1, "leader_required": True},  # 土
-                "6": {"min_work": 6, "min_managers": 1, "leader_required": True},  # 日
-            }
-        }
-        ensure_file_with_template(self.rules_path, template)
-        obj = load_json(self.rules_path, template)
-        rules = obj.get("weekday_rules", {})
-
-        for r in range(7):
-            rule = rules.get(str(r), {})
-            need = int(rule.get("min_work", 0))
-            mgr  = int(rule.get("min_managers", 0))
-            led  = bool(rule.get("leader_required", False))
-            self.table.cellWidget(r, 1).setValue(need)
-            self.table.cellWidget(r, 2).setValue(mgr)
-            self.table.cellWidget(r, 3).setChecked(led)
-
     def save_and_close(self):
-        out = {"weekday_rules": {}}
-        for r in range(7):
-            need = self.table.cellWidget(r, 1).value()
-            mgr  = self.table.cellWidget(r, 2).value()
-            led  = self.table.cellWidget(r, 3).isChecked()
-            out["weekday_rules"][str(r)] = {
-                "min_work": need,
-                "min_managers": mgr,
-                "leader_required": led,
-            }
-        save_json(self.rules_path, out)
+        # 編集中のセルがあれば確定させてから保存
+        self.table.setCurrentIndex(QModelIndex())
+        save_json(self.rules_path, {"weekday_rules": self.model.to_rules()})
         self.accept()
 
 
@@ -1011,10 +1698,19 @@ class WeekdayRulesDialog(QDialog):
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        ensure_data_dir()
+        init_data_dir()
         self.setWindowTitle("手動シフト作成ツール (MVP)")
         self.resize(1400, 800)
 
+        # シフトの保存はワーカースレッドで書き込む（1本に絞って保存順を保つ）。完了通知まで task を保持する
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._pending_saves: list[SaveTask] = []
+
+        # バックグラウンドのチェック（実行中は二重起動しない）
+        self._check_running = False
+        self._check_task: CheckTask | None = None
+
         # スタッフ読み込み（初回テンプレ生成）
         self.staffs: List[Staff] = self.load_or_init_staffs()
 
@@ -1110,6 +1806,12 @@ class MainWindow(QMainWindow):
         self._menu_anim.setDuration(220)
         self._menu_anim.setEasingCurve(QEasingCurve.OutCubic)
 
+        # リサイズ中の連続イベントはまとめて、止まってから1回だけレイアウトを再適用する
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_table_layout_for_window_state)
+
         self._apply_table_layout_for_window_state()
 
         def toggle_menu():
@@ -1161,13 +1863,17 @@ class MainWindow(QMainWindow):
     # どこか UI 初期化（__init__ / set_up_ui など）で月コンボを作っている箇所を置き換え
     # 例：self.month_cb を使っている前提
     def _init_month_combo(self):
-        self.month_cb.clear()
-        items = []
-        for m in range(1, 13):
-            end_m = 1 if m == 12 else m + 1
-            txt = f"{m}-{end_m}"
-            self.month_cb.addItem(txt, m)
-            items.append(txt)
+        # 12件まとめて入れる間はシグナル/再描画を止め、最後に1回だけ反映する
+        self.month_cb.setUpdatesEnabled(False)
+        self.month_cb.blockSignals(True)
+        try:
+            self.month_cb.clear()
+            for m in range(1, 13):
+                end_m = 1 if m == 12 else m + 1
+                self.month_cb.addItem(f"{m}-{end_m}", m)
+        finally:
+            self.month_cb.blockSignals(False)
+            self.month_cb.setUpdatesEnabled(True)
 
         # ▼ ここを修正：列挙値の取り方
         try:
@@ -1181,7 +1887,8 @@ class MainWindow(QMainWindow):
         view = QListView(self.month_cb)
         view.setTextElideMode(Qt.ElideNone)
         fm = self.month_cb.fontMetrics()
-        max_w = max(fm.horizontalAdvance(t) for t in items) + 24
+        # 最長の表示は "10-11" / "11-12" の5文字なので固定の書式で幅を決める
+        max_w = fm.horizontalAdvance("XX-XX") + 24
         view.setMinimumWidth(max_w)
         self.month_cb.setView(view)
 
@@ -1195,12 +1902,11 @@ class MainWindow(QMainWindow):
             {"name": "齋藤", "is_manager": True, "hire_date": "2022-06-01"},
             {"name": "田中", "is_manager": True, "hire_date": "2024-02-01"},
         ]
-        ensure_data_dir()
-        obj = load_json(MEMBERS_JSON, {"members": default_staffs})
+        obj, found = try_load_json(MEMBERS_JSON, {"members": default_staffs})
         # 後方互換：list でも dictでもOKに
         members = obj if isinstance(obj, list) else obj.get("members", default_staffs)
         # 初回生成
-        if not os.path.exists(MEMBERS_JSON):
+        if not found:
             save_json(MEMBERS_JSON, {"members": members})
         return [Staff.from_dict(s) for s in members]
 
@@ -1210,15 +1916,11 @@ class MainWindow(QMainWindow):
         y = int(self.year_cb.currentData()) if self.year_cb.currentData() else int(self.year_cb.currentText())
         m = int(self.month_cb.currentData()) if self.month_cb.currentData() else int(self.month_cb.currentText())
 
-        from calendar import monthrange
-        last = monthrange(y, m)[1]
-        days = list(range(16, last + 1)) + list(range(1, 16))
+        # 日の並びは (年, 月) ごとにキャッシュ。呼び出し側が書き換えてもよいよう list で返す
+        days = list(period_days(y, m))
 
-        # 翌月（12月の場合は翌年の1月）
-        next_m = 1 if m == 12 else m + 1
-
-        # 表示ラベルを「m-next_m」に
-        label = f"{m}-{next_m}"
+        # 表示ラベルを「m-翌月」に（12月の場合は翌年の1月）
+        label = f"{m}-{1 if m == 12 else m + 1}"
 
         return y, m, days, label
 
@@ -1233,62 +1935,67 @@ class MainWindow(QMainWindow):
         y, m, days, _ = self.current_period()
         path = self.sched_path(y, m)
 
-        # 1) 期間（年・月・列=days）をまずモデルへ反映し、列ゼロで表示が消えるのを防ぐ
-        self.model.set_period(y, m, days)
-
-        # 2) 週末/祝日・必要出勤数などのマップを再構築（配色や分母用）
-        if hasattr(self, "_rebuild_period_maps"):
-            self._rebuild_period_maps(y, m, days)
+        # 同じファイルの保存がワーカーに残っていれば、書き終わるのを待ってから読む（保存前の内容を読まない）
+        if any(t.path == path for t in self._pending_saves):
+            self._save_pool.waitForDone()
 
-        # 3) 保存ファイルの有無で分岐
-        new_file = not os.path.exists(path)
-        saved_obj = {} if new_file else load_json(path, {})
+        # 1) 保存ファイルの有無で分岐
+        saved_obj, found = try_load_json(path, {})
+        new_file = not found
 
-        # 4) 既存オブジェクト取り出し（無ければ空の辞書で受ける）
+        # 2) 既存オブジェクト取り出し（無ければ空の辞書で受ける）
         saved_status = (saved_obj.get("status", {}) if isinstance(saved_obj, dict) else {})
         saved_wishes = (saved_obj.get("wishes", {}) if isinstance(saved_obj, dict) else {})
         saved_wish_paid = (saved_obj.get("wish_paid", {}) if isinstance(saved_obj, dict) else {})
         saved_leaders = (saved_obj.get("leaders", {}) if isinstance(saved_obj, dict) else {})
 
-        # 5) 画面構造を再構築
+        # 3) 画面構造を再構築（保存行のキーは先に int へ揃え、空の行に重ねるだけにする）
         names = [s.name for s in self.staffs]
-        new_status, new_wishes, new_wish_paid, new_leaders = {}, {}, {}, {}
-
-        def _get_saved(row_obj, day):
-            """文字列/整数キー両対応で安全に取得"""
-            if isinstance(row_obj, dict):
-                if day in row_obj:  # intキー
-                    return row_obj.get(day)
-                return row_obj.get(str(day))  # strキー
-            return None
+        day_set = frozenset(days)
+        blank_status = dict.fromkeys(days, " ")
+        blank_flags = dict.fromkeys(days, False)
+
+        def _norm(row_obj) -> dict:
+            """文字列/整数キー両対応：期間内の日だけを int キーで取り出す"""
+            if not isinstance(row_obj, dict):
+                return {}
+            out = {}
+            for k, v in row_obj.items():
+                try:
+                    d = int(k)
+                except (TypeError, ValueError):
+                    continue
+                if d in day_set:
+                    out[d] = v
+            return out
+
+        new_status = {nm: {**blank_status, **{d: v or " " for d, v in _norm(saved_status.get(nm)).items()}}
+                      for nm in names}
+        new_wishes = {nm: {**blank_flags, **{d: bool(v) for d, v in _norm(saved_wishes.get(nm)).items()}}
+                      for nm in names}
+        new_wish_paid = {nm: {**blank_flags, **{d: bool(v) for d, v in _norm(saved_wish_paid.get(nm)).items()}}
+                         for nm in names}
+        new_leaders = {d: saved_leaders.get(str(d), "-") for d in days}
+
+        # 4) モデルへ反映。期間・暦・セルの差し替えを1回のリセットにまとめる
+        #    （end_bulk_update でカウンタ/ヘッダを作り直し、ビューへは endResetModel で1回だけ通知）
+        self.model.begin_bulk_update()
+        try:
+            # 期間（年・月・列=days）を反映
+            self.model.set_period(y, m, days)
+
+            # 週末/祝日・必要出勤数などのマップを再構築（配色や分母用）
+            if hasattr(self, "_rebuild_period_maps"):
+                self._rebuild_period_maps(y, m, days)
+
+            self.model.status = new_status
+            self.model.wishes = new_wishes
+            self.model.wish_paid = new_wish_paid
+            self.model.leaders = new_leaders
+        finally:
+            self.model.end_bulk_update()
 
-        for nm in names:
-            row_saved_status = saved_status.get(nm, {})
-            row_saved_wishes = saved_wishes.get(nm, {})
-            row_saved_wish_paid = saved_wish_paid.get(nm, {})
-
-            row_status, row_wish, row_wp = {}, {}, {}
-            for d in days:
-                row_status[d] = _get_saved(row_saved_status, d) or " "
-                row_wish[d] = bool(_get_saved(row_saved_wishes, d))
-                row_wp[d] = bool(_get_saved(row_saved_wish_paid, d))
-            new_status[nm] = row_status
-            new_wishes[nm] = row_wish
-            new_wish_paid[nm] = row_wp
-
-        for d in days:
-            new_leaders[d] = saved_leaders.get(str(d), "-")
-
-        # 6) モデルへ反映
-        self.model.status = new_status
-        self.model.wishes = new_wishes
-        self.model.wish_paid = new_wish_paid
-        self.model.leaders = new_leaders
-
-        # 7) 描画更新
-        self.model.layoutChanged.emit()
-
-        # 8) 案内
+        # 5) 案内
         if new_file:
             QMessageBox.information(self, "新規初期化",
                                     f"保存ファイルが見つからなかったため、新規として初期化しました。\n{os.path.basename(path)}")
@@ -1300,20 +2007,41 @@ class MainWindow(QMainWindow):
         # ✅ 差し替え：MainWindow.on_save の保存先取得部分
         y, m, days, _ = self.current_period()
         path = self.sched_path(y, m)
-        obj = self.model.to_json()
-        save_json(path, obj)
+        task = save_json_async(self._save_pool, path, self.model.to_json())
+        task.signals.finished.connect(self._on_save_finished)
+        task.signals.failed.connect(self._on_save_failed)
+        self._pending_saves.append(task)
+
+    def _drop_pending_save(self, path: str):
+        # 保存は1本のスレッドで順に処理されるので、同じ path のうち最も古いものが完了した task
+        for i, t in enumerate(self._pending_saves):
+            if t.path == path:
+                del self._pending_saves[i]
+                break
+
+    def _on_save_finished(self, path: str):
+        self._drop_pending_save(path)
         QMessageBox.information(self, "保存", f"保存しました。")
 
+    def _on_save_failed(self, path: str, err: str):
+        self._drop_pending_save(path)
+        QMessageBox.critical(self, "保存エラー", f"シフトの保存に失敗しました。\n{path}\n{err}")
+
+    def closeEvent(self, e):
+        # 書き込み途中で終了しないよう、保存待ちを片付けてから閉じる
+        self._save_pool.waitForDone()
+        super().closeEvent(e)
+
     # ---- 前期間末4日の編集（簡易） ----
     def on_edit_prev_tail(self):
         y, m, *_ = self.current_period()  # ← half を取らない
         # 前期間基準（今期が 2025/10 なら 2025/09 が前期基準）
         py, pm = self.prev_period_base(y, m)
         key = f"{py:04d}{pm:02d}_2"  # 末4日は「前期の後半(16-末)」を想定
-        data = load_json(LAST_TAIL_JSON, {})
+        # 既にキーがあれば読むだけ（キャッシュ共有のため書き換えず、無い時だけコピーに足して保存）
+        data = load_json_cached(LAST_TAIL_JSON, {})
         if key not in data:
-            data[key] = {s.name: ["-", "-", "-", "-"] for s in self.staffs}
-            save_json(LAST_TAIL_JSON, data)
+            save_json(LAST_TAIL_JSON, {**data, key: {s.name: ["-"] * 4 for s in self.staffs}})
         if QMessageBox.question(self, "前期間末4日データ",
                                 "JSON を開いて直接編集しますか？\n\nOKで開く / Cancelで閉じる"
                                 ) == QMessageBox.StandardButton.Ok:
@@ -1333,51 +2061,45 @@ class MainWindow(QMainWindow):
 
     # ---- チェック ----
     def on_check(self):
+        if self._check_running:
+            return
         y, m, days, _ = self.current_period()
-        status = self.model.status
+        # 日ループで引く属性は先に並列リストへ展開しておく
         names = [s.name for s in self.staffs]
+        is_mgr = [s.is_manager for s in self.staffs]
+        status_rows = [self.model.status[nm] for nm in names]
+        req_min_work = self.model.req_min_work
+        # リーダーは日ごとに選んだ1人（model.leaders）
+        leaders = self.model.leaders
 
         # 曜日ルールの読み込み（管理職数/リーダー必須の参照用）
-        rules_obj = load_json(WEEKDAY_RULES_JSON, {"weekday_rules": {}})
+        rules_obj = load_json_cached(WEEKDAY_RULES_JSON, {"weekday_rules": {}})
         rules = rules_obj.get("weekday_rules", {})
 
-        msgs = []
-        import calendar
-
-        for d in days:
-            wd = calendar.weekday(y, m, d)  # 0=月 . 6=日
-            r = rules.get(str(wd), {})
+        # 16〜月末は当月 / 1〜15は翌月として曜日を引く（期間ごとにキャッシュ済み）
+        plan = period_plan(y, m)
 
-            # --- 必要出勤数（特別期間優先） ---
-            # 1) モデルが持つ req_min_work（日ごと、特別期間を含めた最終値）
-            need_work = int(getattr(self.model, "req_min_work", {}).get(d, 0) or 0)
-            # 2) 無ければ曜日ルールの min_work をフォールバック
-            if need_work == 0:
-                need_work = int(r.get("min_work", 0))
-
-            # --- 管理職最少/リーダー必須（曜日ルール準拠） ---
-            min_managers = int(r.get("min_managers", 0))
-            leader_req = bool(r.get("leader_required", False))
-
-            # 出勤者カウント（" " が出勤）
-            work_names = [nm for nm in names if status[nm][d] == " "]
-            work_cnt = len(work_names)
-            # 管理職の出勤者
-            mgr_work = sum(1 for s in self.staffs if s.is_manager and status[s.name][d] == " ")
-
-            # 必要出勤数チェック（特別期間を含む最終値）
-            if need_work and work_cnt < need_work:
-                msgs.append(f"{m}/{d}: 出勤者が不足（{work_cnt}/{need_work}）")
-
-            # 管理職チェック（曜日ルール）
-            if min_managers and mgr_work < min_managers:
-                msgs.append(f"{m}/{d}: 管理職が不足（{mgr_work}/{min_managers}）")
-
-            # リーダー必須チェック（1人もいない場合）
-            if leader_req and not any(s.is_leader and status[s.name][d] == " " for s in self.staffs):
-                msgs.append(f"{m}/{d}: リーダーが不在")
+        if len(status_rows) * len(plan) < CHECK_ASYNC_THRESHOLD:
+            self._show_check_result(run_shift_check(plan, rules, req_min_work, names, status_rows, is_mgr, leaders))
+            return
 
-        if not msgs:
+        # 大きい表はワーカースレッドで。実行中に編集されても影響しないようモデルの dict はコピーして渡す
+        task = CheckTask(plan=plan, rules=rules, req_min_work=dict(req_min_work), names=names,
+                         status_rows=[dict(row) for row in status_rows], is_mgr=is_mgr, leaders=dict(leaders))
+        task.signals.finished.connect(self._on_check_finished)
+        self._check_task = task
+        self._check_running = True
+        self.btn_check.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_check_finished(self, msgs):
+        self._check_task = None
+        self._check_running = False
+        self.btn_check.setEnabled(True)
+        self._show_check_result(msgs)
+
+    def _show_check_result(self, msgs: list[str] | None):
+        if msgs is None:
             QMessageBox.information(self, "チェック結果", "全ての条件を満たしています。")
         else:
             text = "\n".join(msgs)
@@ -1392,7 +2114,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "メンバー管理", "保存しました。画面を更新しました。")
 
     def on_open_longvac(self):
-        members_obj = load_json(MEMBERS_JSON, {"members": []})
+        members_obj = load_json_cached(MEMBERS_JSON, {"members": []})
         names = [m.get("name", "") for m in
                  (members_obj.get("members", []) if isinstance(members_obj, dict) else members_obj)]
         dlg = LongVacationDialog(self, vacations_path=VACATIONS_JSON, member_names=names)  # ← ここが実際に使うパス
@@ -1412,67 +2134,39 @@ class MainWindow(QMainWindow):
 
     # MainWindow に追加
     def _rebuild_period_maps(self, y: int, m: int, days: list[int]) -> None:
-        """土日/祝日セット、特別期間による必要出勤数、残有給をモデルに流し込む"""
-        from calendar import weekday, monthrange
-
-        # 翌月（12→1で年繰上げ）
-        next_y, next_m = (y + 1, 1) if m == 12 else (y, m + 1)
-
-        # 祝日読み込み
-        hol_obj = load_json(HOLIDAYS_JSON, {"holidays": []})
-        hol_set = set()
-        for s in hol_obj.get("holidays", []):
-            try:
-                hol_set.add(date.fromisoformat(s))
-            except Exception:
-                pass
-
-        sat_days, hol_days, weekend_days = set(), set(), set()
-        for d in days:
-            # 16〜月末は (y, m, d) / 1〜15は (next_y, next_m, d)
-            yy, mm = (y, m) if d >= 16 else (next_y, next_m)
-            wd = weekday(yy, mm, d)  # 0=Mon ... 6=Sun
-            is_sat = (wd == 5)
-            is_sun = (wd == 6)
-            is_holiday = (date(yy, mm, d) in hol_set)
+        """祝日セット、特別期間による必要出勤数、残有給をモデルに流し込む（model の bulk update 内・set_period の直後に呼ぶ）"""
+        plan = period_plan(y, m)
 
-            if is_sat: sat_days.add(d)
-            if is_sun or is_holiday: hol_days.add(d)
-            if is_sat or is_sun: weekend_days.add(d)
-
-        self.model.sat_days = sat_days
-        self.model.hol_days = hol_days
-        self.model.weekend_days = weekend_days
+        # 土曜/日曜/土日は set_period で計算済み。期間内の祝日だけ日祝セットに足す
+        hol_set = load_holiday_set()
+        self.model.hol_days = self.model.hol_days.union(d for d, _yy, _mm, _wd, dt in plan if dt in hol_set)
 
         # --- 必要出勤数（基本ルール＋特別期間で上書き）---
         # 1) 曜日ごとの基本
-        rules_obj = load_json(WEEKDAY_RULES_JSON, {"weekday_rules": {}})
+        rules_obj = load_json_cached(WEEKDAY_RULES_JSON, {"weekday_rules": {}})
         rules = rules_obj.get("weekday_rules", {})
-        req = {d: int(rules.get(str(weekday((y if d >= 16 else next_y), (m if d >= 16 else next_m), d)), {})
-                      .get("min_work", 0)) for d in days}
+        req = {d: int(rules.get(str(wd), {}).get("min_work", 0)) for d, _yy, _mm, wd, _dt in plan}
 
-        # 2) 特別期間（優先）
-        sp = load_json(SPECIAL_QUOTAS_JSON, {"periods": []})
-        for p in sp.get("periods", []):
-            try:
-                d0 = date.fromisoformat(p.get("start"))
-                d1 = date.fromisoformat(p.get("end"))
-                mw = int(p.get("min_work", 0))
-            except Exception:
+        # 2) 特別期間（優先）。期間の外にある特別期間は日ループに入らない
+        p_first, p_last = plan[0][4], plan[-1][4]
+        for d0, d1, mw in load_special_quota_intervals():
+            if d1 < p_first or p_last < d0:
                 continue
-            if d1 < d0:
-                d0, d1 = d1, d0
-            for d in days:
-                yy, mm = (y, m) if d >= 16 else (next_y, next_m)
-                cur = date(yy, mm, d)
-                if d0 <= cur <= d1:
-                    req[d] = max(req.get(d, 0), mw)  # 特別期間を優先（上書き/最大）
+            for d, _yy, _mm, _wd, cur in plan:
+                if d0 <= cur <= d1 and mw > req.get(d, 0):
+                    req[d] = mw  # 特別期間を優先（上書き/最大）
         self.model.req_min_work = req
 
         # --- 残有給（名前横表示）---
-        mem = load_json(MEMBERS_JSON, {"members": []})
-        paid_map = {m.get("name"): int(m.get("paid_left", 0)) for m in mem.get("members", [])}
-        self.model.paid_left = {s.name: int(paid_map.get(s.name, 0)) for s in self.staffs}
+        mem = load_json_cached(MEMBERS_JSON, {"members": []})
+        # 後方互換：list でも dict でもOKに（メンバー管理の保存は list 形式でも書く）
+        members = mem if isinstance(mem, list) else mem.get("members", [])
+        paid_left = dict.fromkeys((s.name for s in self.staffs), 0)
+        for mb in members:
+            name = mb.get("name")
+            if name in paid_left:
+                paid_left[name] = int(mb.get("paid_left", 0) or 0)
+        self.model.paid_left = paid_left
 
     def _apply_table_layout_for_window_state(self):
         """最大化=全列伸長 / 復元=横スクロール優先。復元時はストレッチ残留幅もリセット。"""
@@ -1485,15 +2179,21 @@ class MainWindow(QMainWindow):
             hh.setSectionResizeMode(QHeaderView.Stretch)
             self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         else:
+            # 既に固定幅で適用済みなら列幅は基準幅のまま（新しい列も defaultSectionSize で作られる）
+            already_fixed = (hh.count() > 0
+                             and hh.sectionResizeMode(0) == QHeaderView.Fixed
+                             and hh.defaultSectionSize() == default_w)
+
             # 復元：横スクロール優先
             hh.setStretchLastSection(False)
             hh.setSectionResizeMode(QHeaderView.Fixed)
             hh.setDefaultSectionSize(default_w)
 
             # ── 重要：ストレッチで広がった“残留幅”を明示的にリセット ──
-            col_count = self.model.columnCount() if self.table.model() else 0
-            for i in range(col_count):
-                hh.resizeSection(i, default_w)
+            if not already_fixed:
+                col_count = self.model.columnCount() if self.table.model() else 0
+                for i in range(col_count):
+                    hh.resizeSection(i, default_w)
 
             # スクロールとサイズ調整方針
             self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -1511,8 +2211,8 @@ class MainWindow(QMainWindow):
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
-        # 復元サイズ時に列がはみ出る/収まる境界で挙動が変わるため、都度再適用
-        QTimer.singleShot(0, self._apply_table_layout_for_window_state)
+        # 復元サイズ時に列がはみ出る/収まる境界で挙動が変わるため再適用（ドラッグ中はタイマーで間引く）
+        self._resize_timer.start()
 
 
 if __name__ == '__main__':